@@ -30,28 +30,87 @@ Example:
 """
 
 import os
+import re
+import sys
+import copy
+import functools
+import hashlib
+import pickle
+import tempfile
 import time
-from typing import Dict, Any, Union, List, Callable
+from typing import Dict, Any, Union, List, Callable, Tuple, Iterable, IO
 import yaml
 from dataclasses import make_dataclass, is_dataclass, asdict
 import logging
 import threading
+from types import SimpleNamespace
 import json
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    # Both variants keep key order and stringify non-str keys (YAML allows e.g. int keys)
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
 KEY_COLOR = 'wheat1'
 SOURCE_COLOR = 'grey30'
 
 log = logging.getLogger(__name__)
 
+# Parsed file contents keyed by (absolute path, st_mtime_ns, st_size).
+# Lets reloads and repeated Config() instantiations skip re-parsing unchanged files.
+_PARSE_CACHE: Dict[tuple, dict] = {}
+
+# Directory for on-disk parse cache (used with Config(use_cache=True))
+_CACHE_DIR = os.environ.get('KIMICONFIG_CACHE', os.path.expanduser('~/.cache/kimiconfig'))
+
+# Sentinel for missing dict keys
+_MISSING = object()
 
-class Singleton(type):
-    _instances = {}
+# Characters in config keys replaced with '_' to make valid dataclass field names
+_KEY_TRANS = str.maketrans({' ': '_', '.': '_', '-': '_'})
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+_TRUE_VALUES = frozenset({'true', 'yes', 'y', '1'})
+_FALSE_VALUES = frozenset({'false', 'no', 'n', '0'})
+# Digits with optional single underscores between them, as int()/float() accept
+_DIGITS = r'\d(?:_?\d)*'
+_NUMBER_RE = re.compile(rf'^[+-]?({_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})([eE][+-]?{_DIGITS})?$')
+# '--key=value' / '--flag' (groups 1, 2) or '-f' (group 3)
+_ARG_RE = re.compile(r'^--([^=]*)(?:=(.*))?$|^-(.*)$', re.DOTALL)
 
+log.debug(f"Using YAML loader: {_YamlLoader.__name__}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Splits a dotted key into its path parts (cached, keys recur on every update)
+
+    Args:
+        key: Dotted key, e.g. 'server.port'
+
+    Returns:
+        Tuple of key parts (interned)
+    """
+    return tuple(sys.intern(part) for part in key.split('.'))
 
 
 def _parse_args(args: List[str]) -> Dict[str, Any]:
@@ -65,27 +124,205 @@ def _parse_args(args: List[str]) -> Dict[str, Any]:
         Dictionary with parsed arguments
     """
     result = {}
+    match = _ARG_RE.match
     for arg in args:
-        if arg.startswith('--'):
-            if '=' in arg:
-                key, value = arg[2:].split('=', 1)
-                if '.' in key:
-                    parts = key.split('.')
-                    current = result
-                    for part in parts[:-1]:
-                        if part not in current:
-                            current[part] = {}
-                        current = current[part]
-                    current[parts[-1]] = _convert_value(value)
-                else:
-                    result[key] = _convert_value(value)
-            else:
-                result[arg[2:]] = True
-        elif arg.startswith('-'):
-            result[arg[1:]] = True
+        m = match(arg)
+        if m is None:
+            continue
+        key, value, short_key = m.groups()
+        if short_key is not None:
+            result[short_key] = True
+        elif value is None:
+            result[key] = True
+        elif '.' in key:
+            parts = _split_key(key)
+            current = result
+            for part in parts[:-1]:
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
+            current[parts[-1]] = _convert_value(value)
+        else:
+            result[key] = _convert_value(value)
     return result
 
 
+def _intern_keys(data: Any) -> Any:
+    """
+    Interns all string keys of nested dictionaries in place, so repeated
+    merges and lookups of the same keys compare by identity.
+
+    Args:
+        data: Parsed configuration data
+
+    Returns:
+        The same data
+    """
+    intern = sys.intern
+    stack = [data]
+    # YAML aliases can share a dict or even make it contain itself
+    seen = set()
+    while stack:
+        d = stack.pop()
+        if type(d) is not dict or id(d) in seen:
+            continue
+        seen.add(id(d))
+        # Rebuild rather than pop/insert, to keep key order
+        interned = {intern(k) if type(k) is str else k: v for k, v in d.items()}
+        d.clear()
+        d.update(interned)
+        stack.extend(v for v in interned.values() if type(v) is dict)
+    return data
+
+
+def _yaml_load(f) -> Any:
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+def _json_load(f) -> Any:
+    return _json_loads(f.read())
+
+# Loaders by file extension
+_LOADERS: Dict[str, Callable[[Any], Any]] = {
+    '.yaml': _yaml_load,
+    '.yml': _yaml_load,
+    '.json': _json_load,
+}
+
+
+def _get_loader(file: str) -> Callable[[Any], Any]:
+    """
+    Resolves the loader for a configuration file by its extension
+
+    Args:
+        file: Path to the configuration file
+
+    Returns:
+        Function parsing an open binary file
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    loader = _LOADERS.get(os.path.splitext(file)[1].lower())
+    if loader is None:
+        raise ValueError(
+            f"Unsupported configuration file format: {file}. "
+            f"Supported extensions: {', '.join(_LOADERS)}"
+        )
+    return loader
+
+
+def _parse_file(file: str, loader: Callable[[Any], Any]) -> dict:
+    """
+    Parses a configuration file
+
+    Args:
+        file: Path to the configuration file
+        loader: Loader for the file format (see _get_loader)
+
+    Returns:
+        Parsed configuration data
+    """
+    with open(file, 'rb') as f:
+        return loader(f) or {}
+
+
+def _parse_stream(stream: IO) -> dict:
+    """
+    Parses configuration from an open file-like object. The format is taken
+    from the extension of stream.name if there is one, YAML otherwise.
+
+    Args:
+        stream: Text or binary stream, e.g. io.StringIO or an open file
+
+    Returns:
+        Parsed configuration data
+
+    Raises:
+        ValueError: If the stream does not contain a mapping at the top level
+    """
+    name = getattr(stream, 'name', '')
+    ext = os.path.splitext(name)[1].lower() if isinstance(name, str) else ''
+    data = _LOADERS.get(ext, _yaml_load)(stream) or {}
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"Configuration stream {name or stream!r} must contain a mapping "
+            f"at the top level, got {type(data).__name__}"
+        )
+    return _intern_keys(data)
+
+
+def _load_cached(file: str, st: os.stat_result, loader: Callable[[Any], Any]) -> dict:
+    """
+    Loads parsed file contents from the on-disk pickle cache,
+    parsing the file and refreshing the cache on a miss.
+
+    Args:
+        file: Path to the configuration file
+        st: Result of os.stat() on the file
+        loader: Loader for the file format (see _get_loader)
+
+    Returns:
+        Parsed configuration data
+    """
+    abs_path = os.path.abspath(file)
+    path_hash = hashlib.blake2b(abs_path.encode(), digest_size=8).hexdigest()
+    stamp_hash = hashlib.blake2b(
+        f"{abs_path}:{st.st_mtime_ns}:{st.st_size}".encode(), digest_size=16
+    ).hexdigest()
+    prefix = f"{os.path.basename(file)}.{path_hash}."
+    cache_path = os.path.join(_CACHE_DIR, f"{prefix}{stamp_hash}.pkl")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.debug(f"Ignoring unreadable cache {cache_path}: {e}")
+
+    data = _parse_file(file, loader)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Evict caches of previous versions of this file
+        for entry in os.listdir(_CACHE_DIR):
+            if entry.startswith(prefix):
+                os.remove(os.path.join(_CACHE_DIR, entry))
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        log.debug(f"Could not write cache {cache_path}: {e}")
+    return data
+
+
+def _read_config_file(file: str, loader: Callable[[Any], Any], use_cache: bool = False) -> dict:
+    """
+    Reads and parses a YAML or JSON configuration file, using the parse cache
+    if the file has not changed since it was last parsed.
+
+    Args:
+        file: Path to the configuration file
+        loader: Loader for the file format (see _get_loader)
+        use_cache: Also use the on-disk cache in _CACHE_DIR
+
+    Returns:
+        Parsed configuration data (a private copy, safe to mutate)
+    """
+    st = os.stat(file)
+    abs_path = os.path.abspath(file)
+    key = (abs_path, st.st_mtime_ns, st.st_size)
+    data = _PARSE_CACHE.get(key)
+    if data is None:
+        data = _intern_keys(_load_cached(file, st, loader) if use_cache else _parse_file(file, loader))
+        # Drop stale entries for the same file so the cache doesn't grow on every edit
+        for stale in [k for k in _PARSE_CACHE if k[0] == abs_path]:
+            del _PARSE_CACHE[stale]
+        _PARSE_CACHE[key] = data
+    return copy.deepcopy(data)
+
+
 def _convert_value(value: Any) -> Any:
     """
     Convert string values to appropriate types
@@ -98,23 +335,84 @@ def _convert_value(value: Any) -> Any:
     """
     if not isinstance(value, str):
         return value
-        
+    return _convert_str(value)
+
+
+@functools.lru_cache(maxsize=2048)
+def _convert_str(value: str) -> Any:
+    """
+    Converts a string to bool, int or float if it looks like one
+    (cached, the same values recur across env vars, args and reloads)
+
+    Args:
+        value: String to convert
+
+    Returns:
+        Converted value, or the string itself
+    """
     # Check for boolean values
-    if value.lower() in ('true', 'yes', 'y', '1'):
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if value.lower() in ('false', 'no', 'n', '0'):
+    if lowered in _FALSE_VALUES:
         return False
-    
-    # Check for numbers
-    try:
-        if '.' in value:
-            return float(value)
-        return int(value)
-    except ValueError:
+
+    # Check for numbers (surrounding whitespace is ignored, as int()/float() do)
+    number = value.strip()
+    if not _NUMBER_RE.match(number):
         return value
+    if '.' in number or 'e' in lowered:
+        return float(number)
+    return int(number)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_dataclass(class_name: str, fields: Tuple[Tuple[str, Any], ...]) -> type:
+    """
+    Creates a frozen dataclass with the given fields, all defaulting to None.
+    Cached by class name and (field name, field type) signature, because
+    make_dataclass generates and exec()s code for every class.
 
+    Args:
+        class_name: Name of the created class
+        fields: Tuple of (field name, field type) pairs
 
-class Config(metaclass=Singleton):
+    Returns:
+        Dataclass type
+    """
+    return make_dataclass(class_name, [(name, field_type, None) for name, field_type in fields],
+                          frozen=True)
+
+
+# Rich console and classes, imported on first use (rich is optional and slow to import)
+_rich = None
+
+
+def _import_rich(feature: str) -> SimpleNamespace:
+    """
+    Imports rich once and returns a namespace with a shared recording console
+    and the Tree and Table classes.
+
+    Args:
+        feature: Name of the method requiring rich, used in the error message
+
+    Raises:
+        ImportError: If rich is not installed
+    """
+    global _rich
+    if _rich is None:
+        try:
+            from rich.console import Console
+            from rich.table import Table
+            from rich.tree import Tree
+        except ImportError:
+            raise ImportError(f"To use {feature}, you need to install 'rich' (pip install rich)")
+        # export_text() clears the recorded output, so one console can be reused
+        _rich = SimpleNamespace(console=Console(record=True), Table=Table, Tree=Tree)
+    return _rich
+
+
+class Config:
     """
     Configuration management class implementing singleton pattern.
     Provides flexible configuration handling with support for multiple sources and formats.
@@ -136,11 +434,14 @@ class Config(metaclass=Singleton):
         shutdown_flag (bool): Flag to stop the polling thread
                               Can be used as shutdown flag for other threads
     Args:
-        file (Union[str, List[str]]): Path(s) to YAML or JSON configuration file(s). Later files override earlier ones.
+        file (Union[str, PathLike, IO, List[Union[str, PathLike, IO]]]): Path(s) to YAML or JSON configuration file(s). Later files override earlier ones.
+                          File-like objects (e.g. io.StringIO) are read once on load and not watched.
         args (List[str], optional): Command line arguments to parse and apply.
         use_dataclasses (bool): Convert nested dictionaries to dataclasses for better type hints.
         watch_mtime (bool): Enable automatic config reload when files change.
         watch_interval (int): Interval in seconds for checking file modifications.
+        use_cache (bool): Keep parsed files in an on-disk pickle cache between runs
+                          (in $KIMICONFIG_CACHE or ~/.cache/kimiconfig).
 
     Example:
         ```python
@@ -169,19 +470,44 @@ class Config(metaclass=Singleton):
         will return the same object. Use _reset() for testing purposes.
     """
 
-    def __init__(self, file: Union[str, List[str]] = '', 
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        # Singleton: every instantiation returns the same object (one per class)
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+        return instance
+
+    def __init__(self, file: Union[str, os.PathLike, IO, List[Union[str, os.PathLike, IO]], None] = '', 
                  args: List[str]|None = None, 
                  use_dataclasses: bool = True,
                  env_prefix: str = 'DEFAULT_APP_',
                  watch_mtime: bool = False, 
-                 watch_interval: int = 15):
+                 watch_interval: int = 15,
+                 use_cache: bool = False):
+        if self.__dict__.get('_initialized'):
+            return
+        # Guards source layers, 'data' and attributes against concurrent reloads and updates
+        self._lock = threading.RLock()
         self._use_dataclasses = use_dataclasses
+        self._use_cache = use_cache
+        # Hashes of top-level sections, to skip rebuilding dataclasses for unchanged ones
+        self._prev_data_hashes: Dict[str, int] = {}
+        # Dataclass sections not built yet, converted on first attribute access
+        self._pending_sections: Dict[str, dict] = {}
+        # Top-level keys currently set as attributes from 'data'
+        self._attr_keys = set()
         self.data = {}
         # Inside data is stored by source and merges (from top to bottom) to 'self.data' after any change:
         self._file_data = {}
         self._env_data = {}
         self._args_data = {}
         self._runtime_update_data = {}
+        # Bumped whenever the file, env or args layer changes; keys the cached merge below runtime
+        self._lower_layers_version = 0
+        self._merged_below_runtime: dict = {}
+        self._merged_below_runtime_version = -1
 
         # For runtime variables sometimes it's useful placing them in one branch.
         self.runtime: dict
@@ -189,18 +515,20 @@ class Config(metaclass=Singleton):
         self._args = {}
         self.shutdown_flag = False
         self._update_callbacks: List[Callable[[], None]] = []
+        self._observer = None
+        self._reload_timer: threading.Timer|None = None
         self._init_default_logging()
         
-        # Convert file to list
-        self.files = [file] if isinstance(file, str) and file else \
-                    list(file) if file else []
+        # (path, None) for files and (None, parsed data) for file-like sources, in override order
+        self._sources: List[Tuple[Union[str, None], Union[dict, None]]] = []
+        self.files = []
+        self._loaders = {}
+        self._add_sources(file)
         self.file_stamps = {}
         
         # Load configuration from files
-        if self.files:
-            for f in self.files:
-                if os.path.exists(f):
-                    self.file_stamps[f] = os.stat(f).st_mtime
+        if self._sources:
+            self.file_stamps = self._current_file_stamps()
             self._load_from_files()
 
         # Load configuration from environment variables
@@ -213,8 +541,9 @@ class Config(metaclass=Singleton):
         
         self._update_data_from_all_x_data()._update_attributes_from_data()
 
-        # Start polling in separate thread if enabled
-        if watch_mtime:
+        # Watch files with OS notifications (watchdog) if enabled,
+        # falling back to polling in separate thread
+        if watch_mtime and not self._start_file_observer():
             self.polling_thread = threading.Thread(
                 target=self._config_file_polling_thread,
                 args=(watch_interval,)
@@ -222,6 +551,10 @@ class Config(metaclass=Singleton):
             self.polling_thread.daemon = True
             self.polling_thread.start()
 
+        # Registered only once fully initialized, so a failed init isn't reused
+        self._initialized = True
+        type(self)._instance = self
+
     def _init_default_logging(self):
         self.logging = {
             'level': "INFO",
@@ -241,66 +574,121 @@ class Config(metaclass=Singleton):
             args_dict: Dictionary with arguments
         """
         for key, value in args_dict.items():
-            if '.' in key:
-                parts = key.split('.')
-                current = {}
-                temp = current
-                for part in parts[:-1]:
-                    temp[part] = {}
-                    temp = temp[part]
-                temp[parts[-1]] = _convert_value(value)
-                self._deep_update(self._args_data, current, 'CLI args')
-            else:
-                self._deep_update(self._args_data, {key: _convert_value(value)}, 'CLI args')
+            self._set_path(self._args_data, _split_key(key), _convert_value(value))
+        self._lower_layers_version += 1
 
     def _load_from_env(self, prefix: str = 'DEFAULT_APP_'):
         """Loads configuration from environment variables"""
+        prefix_len = len(prefix)
+        # Sorted keys put siblings next to each other, so the descent into
+        # their common parent sections can be reused between keys.
+        matches = sorted(
+            (key[prefix_len:].lower().replace('__', '.'), value)
+            for key, value in os.environ.items()
+            if key.startswith(prefix)
+        )
         env_data = {}
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                config_key = key[len(prefix):].lower().replace('__', '.')
-                if '.' in config_key:
-                    parts = config_key.split('.')
-                    current = env_data
-                    for part in parts[:-1]:
-                        current = current.setdefault(part, {})
-                    current[parts[-1]] = _convert_value(value)
-                else:
-                    env_data[config_key] = _convert_value(value)
+        prev_parts: Tuple[str, ...] = ()
+        path = [env_data]  # path[i] is the section dict for prev_parts[:i]
+        for config_key, value in matches:
+            parts = _split_key(config_key)
+            limit = min(len(parts), len(prev_parts)) - 1
+            common = 0
+            while common < limit and parts[common] == prev_parts[common]:
+                common += 1
+            del path[common + 1:]
+            current = path[-1]
+            for part in parts[common:-1]:
+                nested = current.get(part)
+                if type(nested) is not dict:
+                    # 'DB' sorts before 'DB__HOST': the nested key turns the value into a section
+                    nested = current[part] = {}
+                current = nested
+                path.append(current)
+            current[parts[-1]] = _convert_value(value)
+            prev_parts = parts
         self._deep_update(self._env_data, env_data, 'environment')
+        self._lower_layers_version += 1
 
     def _deep_update(self, d: dict, u: dict, source: str = 'unknown') -> None:
         """
-        Recursively updates dictionary d with data from dictionary u
+        Deeply updates dictionary d with data from dictionary u.
+        Nested dictionaries are merged (copied, never aliased), other values are replaced.
         
         Args:
             d: Target dictionary
             u: Source dictionary
             source: Source identifier (file/env/args/runtime)
+
+        Raises:
+            ValueError: If u contains itself (e.g. via a YAML alias)
         """
-        for k, v in u.items():
-            if isinstance(v, dict):
-                d[k] = d.get(k, {})
-                if isinstance(d[k], dict):
-                    self._deep_update(d[k], v, source)
+        if not u:
+            return
+        # Exact type checks are cheaper than isinstance() and match the plain
+        # dicts produced by the YAML/JSON loaders and env/args parsing.
+        _dict = dict
+        _type = type
+        # Each entry carries the ids of the source dicts on its path, to detect cycles
+        stack = [(d, u, frozenset((id(u),)))]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            dst, src, path = pop()
+            for k, v in src.items():
+                if _type(v) is _dict:
+                    if id(v) in path:
+                        raise ValueError(f"Section '{k}' from {source} contains itself")
+                    cur = dst.get(k)
+                    if _type(cur) is not _dict:
+                        cur = dst[k] = {}
+                    push((cur, v, path | {id(v)}))
                 else:
-                    d[k] = v
-            else:
-                d[k] = v
+                    dst[k] = v
+
+    def _set_path(self, target: dict, parts: Tuple[str, ...], value: Any) -> None:
+        """
+        Sets a value at a key path in target, creating sections along the way.
+        Non-dict values on the path are replaced; dict values are deep-merged
+        into an existing section, same as _deep_update would do.
+
+        Args:
+            target: Dictionary to update
+            parts: Key path, e.g. ('server', 'port')
+            value: Value to set
+        """
+        current = target
+        for part in parts[:-1]:
+            nested = current.get(part)
+            if not isinstance(nested, dict):
+                nested = current[part] = {}
+            current = nested
+        last = parts[-1]
+        if isinstance(value, dict):
+            section = current.get(last)
+            if not isinstance(section, dict):
+                section = current[last] = {}
+            self._deep_update(section, value)
+        else:
+            current[last] = value
 
     def _load_from_files(self):
         """Loads configuration from all files"""
-        self._file_data.clear()
-        for file in self.files:
+        file_data = {}
+        for file, stream_data in self._sources:
+            if file is None:
+                # Already parsed file-like source, copied as the merge shares nested values
+                self._deep_update(file_data, copy.deepcopy(stream_data), 'stream')
+                continue
             try:
-                with open(file, 'r') as f:
-                    if file.lower().endswith(('.yaml', '.yml')):
-                        new_data = yaml.safe_load(f) or {}
-                    elif file.lower().endswith('.json'):
-                        new_data = json.load(f) or {}
-                    self._deep_update(self._file_data, new_data, f'{file}')
+                new_data = _read_config_file(file, self._loaders[file], self._use_cache)
+                self._deep_update(file_data, new_data, f'{file}')
             except Exception as e:
                 log.error(f"Error loading configuration from {file}: {e}")
+        # Swap in the fully built dict, so readers never see it half-loaded
+        with self._lock:
+            self._file_data = file_data
+            self._lower_layers_version += 1
 
     def _dict_to_dataclass(self, data: Dict[str, Any], class_name: str = 'ConfigData') -> Any:
         """
@@ -318,46 +706,49 @@ class Config(metaclass=Singleton):
         
         for key, value in data.items():
             # Convert key to string and replace spaces and dots with underscores
-            key_str = str(key).translate(str.maketrans({' ': '_', '.': '_', '-': '_'}))
+            key_str = (key if isinstance(key, str) else str(key)).translate(_KEY_TRANS)
             
             if isinstance(value, dict):
                 # Recursively create a dataclass for the nested dictionary
                 nested_class_name = f"{class_name}_{key_str}"
-                field_type = self._dict_to_dataclass(value, nested_class_name)
-                fields.append((key_str, field_type, None))
-                values[key_str] = field_type
+                nested = self._dict_to_dataclass(value, nested_class_name)
+                fields.append((key_str, type(nested)))
+                values[key_str] = nested
             else:
                 # Use Any for simple types to avoid typing issues
-                fields.append((key_str, Any, None))
+                fields.append((key_str, Any))
                 values[key_str] = value
         
-        # Dynamically create a new dataclass
-        dynamic_class = make_dataclass(class_name, fields)
+        # Dynamically create a new dataclass, reusing one already built for the same shape.
+        # Nested classes are cached too, so their types identify the nested shapes.
+        dynamic_class = _make_dataclass(class_name, tuple(fields))
         # Create and return an instance with our values
         return dynamic_class(**values)
 
+    @classmethod
+    def _protected_names(cls) -> frozenset:
+        """
+        Returns names of callable class attributes (methods, including inherited ones).
+        Computed once per class, instead of scanning dir(self) on every update.
+        """
+        names = cls.__dict__.get('_protected_names_cache')
+        if names is None:
+            names = frozenset(n for n in dir(cls) if callable(getattr(cls, n, None)))
+            cls._protected_names_cache = names
+        return names
+
     def _validate_attribute_override(self, data_to_check: Dict[str, Any]):
         """
         Checks if any top-level keys in data_to_check would override
         existing methods or "protected" attributes of the Config instance.
         """
-        conflicting_keys = []
-        # Consider attributes of the class itself (methods, class variables)
-        # and also instance-specific attributes that might be critical (e.g., _file_data)
-        # dir(self) gives all attributes, including methods and inherited ones.
-        # We are primarily interested in preventing override of methods and core attributes.
-        instance_attrs = dir(self)
-
-        for key in data_to_check.keys():
-            if key in instance_attrs:
-                # Check if it's a method or a "protected" variable (by convention, starts with '_')
-                # We allow overriding normal data attributes that might have been set by previous configs.
-                attr = getattr(self, key)
-                if callable(attr):
-                    conflicting_keys.append(key)
-                # Example of protecting specific non-method attributes if needed:
-                # elif key in ['data', '_file_data', '_env_data', '_args_data', '_runtime_update_data', 'shutdown_flag']:
-                #     conflicting_keys.append(key)
+        # Methods (and other callables) of the class must not be shadowed by config keys.
+        # We allow overriding normal data attributes that might have been set by previous configs.
+        protected = self._protected_names()
+        conflicting_keys = [key for key in data_to_check if key in protected]
+        # Example of protecting specific non-method attributes if needed:
+        # conflicting_keys += [key for key in data_to_check
+        #                      if key in ('data', '_file_data', '_env_data', '_args_data', '_runtime_update_data', 'shutdown_flag')]
 
         if conflicting_keys:
             conflicting_keys.sort()
@@ -366,84 +757,314 @@ class Config(metaclass=Singleton):
                 f"Please rename these keys in your configuration."
             )
 
+    def _rebuild_data(self, layers: List[dict]) -> dict:
+        """
+        Merges source layers (lowest precedence first) into a new dictionary.
+        Only keys present in the layers are visited, and nested dictionaries
+        are merged only where they overlap in two or more layers.
+
+        Args:
+            layers: Source dictionaries ordered by precedence, lowest first
+
+        Returns:
+            Merged dictionary (shares no dicts with the layers)
+        """
+        result = {}
+        _dict = dict
+        _type = type
+        deep_update = self._deep_update
+        rebuild = self._rebuild_data
+        present = [layer for layer in layers if layer]
+        if len(present) == 1:
+            deep_update(result, present[0])
+            return result
+        for k in _dict.fromkeys(k for layer in present for k in layer):
+            values = [layer[k] for layer in present if k in layer]
+            top = values[-1]
+            if _type(top) is not _dict:
+                result[k] = top
+                continue
+            # Only the topmost run of dicts is merged: a non-dict value below it is overridden
+            dicts = []
+            for v in reversed(values):
+                if _type(v) is not _dict:
+                    break
+                dicts.append(v)
+            dicts.reverse()
+            if len(dicts) == 1:
+                merged = {}
+                deep_update(merged, top)
+                result[k] = merged
+            else:
+                result[k] = rebuild(dicts)
+        return result
+
     def _update_data_from_all_x_data(self):
         """Updates configuration data and validates before applying attributes"""
-        # Clear and rebuild self.data from all sources
-        self.data.clear()
-        self._deep_update(self.data, self._file_data)
-        self._deep_update(self.data, self._env_data)
-        self._deep_update(self.data, self._args_data)
-        self._deep_update(self.data, self._runtime_update_data)
-        
-        # Validate before attempting to set attributes
-        self._validate_attribute_override(self.data)
-        return self
+        with self._lock:
+            # File, env and args layers change rarely (reloads, load_*), so their
+            # merge is cached and only the runtime layer is merged on top of it.
+            if self._merged_below_runtime_version != self._lower_layers_version:
+                self._merged_below_runtime = self._rebuild_data([
+                    self._file_data,
+                    self._env_data,
+                    self._args_data,
+                ])
+                self._merged_below_runtime_version = self._lower_layers_version
+            # _rebuild_data copies nested dicts, so the cached merge is never mutated via self.data
+            new_data = self._rebuild_data([self._merged_below_runtime, self._runtime_update_data])
+            # Validate before attempting to set attributes
+            self._validate_attribute_override(new_data)
+            # Swap in the new dict: stale keys disappear and readers never see it half-built
+            self.data = new_data
+            return self
+
+    def _stage_attribute(self, k: str, v: Any, plain_attrs: Dict[str, Any]) -> None:
+        """
+        Prepares the attribute for a top-level configuration key.
+        Plain values are collected into plain_attrs. In dataclass mode a changed
+        section is deferred and only converted on first access (see __getattr__),
+        an unchanged one keeps its existing attribute.
+        """
+        hashes = self._prev_data_hashes
+        pending = self._pending_sections
+        if self._use_dataclasses and type(v) is dict:
+            data_hash = hash(repr(v))
+            if hashes.get(k) == data_hash and (k in self.__dict__ or k in pending):
+                return
+            hashes[k] = data_hash
+            # Stage before dropping the old attribute, so lock-free readers always find one of them
+            pending[k] = v
+            self.__dict__.pop(k, None)
+        else:
+            hashes.pop(k, None)
+            pending.pop(k, None)
+            plain_attrs[k] = v
+
+    def _set_attribute_from_data(self, k: str, v: Any) -> None:
+        """Sets a single top-level class attribute from configuration data"""
+        plain_attrs = {}
+        self._stage_attribute(k, v, plain_attrs)
+        self.__dict__.update(plain_attrs)
+        self._attr_keys.add(k)
 
     def _update_attributes_from_data(self):
         """Updates class attributes from configuration data"""
-        if self._use_dataclasses:
-            for k, v in self.data.items():
-                if isinstance(v, dict):
-                    setattr(self, k, self._dict_to_dataclass(v, f"Config_{k}"))
-                else:
-                    setattr(self, k, v)
-        else:
-            for k, v in self.data.items():
-                setattr(self, k, v)
+        with self._lock:
+            data = self.data
+            attrs = self.__dict__
+            # Drop attributes of keys no longer present in any source
+            for k in self._attr_keys.difference(data):
+                attrs.pop(k, None)
+                self._pending_sections.pop(k, None)
+                self._prev_data_hashes.pop(k, None)
+                if k == 'logging':
+                    self._init_default_logging()
+            self._attr_keys = set(data)
+
+            plain_attrs = {}
+            stage = self._stage_attribute
+            for k, v in data.items():
+                stage(k, v, plain_attrs)
+            attrs.update(plain_attrs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes: materializes deferred dataclass sections
+        pending = self.__dict__.get('_pending_sections')
+        if pending is not None and name in pending:
+            with self._lock:
+                if name in pending:
+                    # Dropped from pending only once converted, so a failing section raises on every access
+                    self.__dict__[name] = self._dict_to_dataclass(pending[name], f"Config_{name}")
+                    del pending[name]
+                # Another thread may have removed the key before the lock was taken
+                value = self.__dict__.get(name, _MISSING)
+                if value is not _MISSING:
+                    return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def update(self, key: str, value: Any):
-        """Updates a value in the configuration"""
-        if '.' in key:
-            parts = key.split('.')
-            current = {}
-            temp = current
-            for part in parts[:-1]:
-                temp[part] = {}
-                temp = temp[part]
-            temp[parts[-1]] = value
-            self._deep_update(self._runtime_update_data, current, 'runtime_update')
-        else:
-            self._deep_update(self._runtime_update_data, {key: value}, 'runtime_update')
-        self._update_data_from_all_x_data()._update_attributes_from_data()
+        """
+        Updates a value in the configuration.
+        Only the affected path in 'data' and its top-level attribute are refreshed.
+        To change several keys at once prefer update_many().
+        """
+        self.update_many({key: value})
+
+    def update_many(self, updates: Union[Dict[str, Any], Iterable[Tuple[str, Any]]]) -> None:
+        """
+        Updates several values in the configuration at once.
+        Each touched top-level attribute is refreshed only once, so this is
+        the preferred way to apply many runtime updates.
+
+        Args:
+            updates: Mapping or iterable of (dotted key, value) pairs
+
+        Example:
+            ```python
+            cfg.update_many({'server.port': 9000, 'server.host': '0.0.0.0'})
+            ```
+        """
+        items = [(_split_key(key), value)
+                 for key, value in (updates.items() if isinstance(updates, dict) else updates)]
+        with self._lock:
+            top_keys = dict.fromkeys(parts[0] for parts, _ in items)
+            self._validate_attribute_override(top_keys)
+
+            for parts, value in items:
+                self._set_path(self._runtime_update_data, parts, value)
+
+            if self._merged_below_runtime_version != self._lower_layers_version:
+                self._update_data_from_all_x_data()
+            else:
+                # Only the touched top-level keys are rebuilt from the layers. Patching
+                # self.data in place would lose lower-layer values wherever an earlier
+                # update had replaced a section with a non-dict.
+                below = self._merged_below_runtime
+                runtime = self._runtime_update_data
+                for k in top_keys:
+                    layers = [{k: below[k]}] if k in below else []
+                    layers.append({k: runtime[k]})
+                    self.data[k] = self._rebuild_data(layers)[k]
+
+            for k in top_keys:
+                self._set_attribute_from_data(k, self.data[k])
 
     def _config_file_polling_thread(self, interval: int):
         """Monitors changes in all configuration files"""
         while not self.shutdown_flag:
             time.sleep(interval)
-            reload_needed = False
-            
+            current_stamps = self._current_file_stamps()
+            if any(stamp != self.file_stamps.get(file) for file, stamp in current_stamps.items()):
+                self.file_stamps.update(current_stamps)
+                self._reload_files()
+
+    def _current_file_stamps(self) -> Dict[str, int]:
+        """
+        Returns st_mtime_ns of all existing configuration files in one pass.
+        On Windows files are grouped by directory and read with os.scandir(),
+        where DirEntry.stat() needs no extra system call. Elsewhere DirEntry.stat()
+        costs a stat() anyway, so each file is stat()ed directly.
+        """
+        stamps = {}
+        if os.name != 'nt':
             for file in self.files:
-                if not os.path.exists(file):
+                try:
+                    stamps[file] = os.stat(file).st_mtime_ns
+                except OSError:
                     continue
-                    
-                current_stamp = os.stat(file).st_mtime
-                if current_stamp != self.file_stamps.get(file):
-                    self.file_stamps[file] = current_stamp
-                    reload_needed = True
-            
-            if reload_needed:
-                self._file_data.clear()  # Clear old data
-                self._load_from_files()  # Reload all files
-                self._update_data_from_all_x_data()._update_attributes_from_data()
-                for callback in self._update_callbacks:
-                    try:
-                        callback()
-                    except Exception as e:
-                        log.error(f"Error executing update callback {getattr(callback, '__name__', 'unknown')}: {e}")
-
-    def load_files(self, files: list[str]):
-        """Loads configuration from files"""
-        if isinstance(files, str):
+            return stamps
+
+        # Names are compared normcased, NTFS is case-insensitive
+        normcase = os.path.normcase
+        by_dir: Dict[str, Dict[str, str]] = {}
+        for file in self.files:
+            by_dir.setdefault(os.path.dirname(file) or '.', {})[normcase(os.path.basename(file))] = file
+        for directory, names in by_dir.items():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        file = names.get(normcase(entry.name))
+                        if file is not None:
+                            stamps[file] = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+        return stamps
+
+    def _reload_files(self):
+        """Reloads all configuration files and runs update callbacks"""
+        with self._lock:
+            self._load_from_files()  # Reload all files
+            self._update_data_from_all_x_data()._update_attributes_from_data()
+        for callback in self._update_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                log.error(f"Error executing update callback {getattr(callback, '__name__', 'unknown')}: {e}")
+
+    def _start_file_observer(self) -> bool:
+        """
+        Starts watching configuration files with OS-level notifications
+        (inotify, FSEvents, ReadDirectoryChangesW) via watchdog.
+
+        Returns:
+            bool: False if watchdog is not installed
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            log.debug("watchdog is not installed, falling back to polling config files")
+            return False
+
+        config = self
+
+        class _ConfigFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Ignore opened/closed events, reloading itself would trigger them
+                if event.is_directory or event.event_type not in ('modified', 'created', 'moved'):
+                    return
+                paths = (event.src_path, getattr(event, 'dest_path', ''))
+                if any(p and os.path.abspath(p) in config._watched_files for p in paths):
+                    config._schedule_reload()
+
+        self._watched_files = set()
+        self._watched_dirs = set()
+        self._file_event_handler = _ConfigFileHandler()
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._watch_files()
+        self._observer.start()
+        return True
+
+    def _watch_files(self):
+        """Schedules parent directories of all config files on the observer"""
+        for file in self.files:
+            path = os.path.abspath(file)
+            self._watched_files.add(path)
+            directory = os.path.dirname(path)
+            if directory not in self._watched_dirs and os.path.isdir(directory):
+                self._observer.schedule(self._file_event_handler, directory, recursive=False)
+                self._watched_dirs.add(directory)
+
+    def _schedule_reload(self, delay: float = 0.05):
+        """Debounces a burst of file events into a single reload"""
+        if self._reload_timer is not None:
+            self._reload_timer.cancel()
+        self._reload_timer = threading.Timer(delay, self._reload_files)
+        self._reload_timer.daemon = True
+        self._reload_timer.start()
+
+    def _add_sources(self, files: Union[str, os.PathLike, IO, Iterable[Union[str, os.PathLike, IO]], None]):
+        """Appends configuration sources, parsing file-like ones right away"""
+        if not files:
+            return
+        if isinstance(files, (str, os.PathLike)) or hasattr(files, 'read'):
             files = [files]
-        self.files.extend(files)
-        self._load_from_files()
-        self._update_data_from_all_x_data()._update_attributes_from_data()
+        for f in files:
+            if hasattr(f, 'read'):
+                self._sources.append((None, _parse_stream(f)))
+            else:
+                f = os.fspath(f)
+                self._loaders[f] = _get_loader(f)
+                self._sources.append((f, None))
+                self.files.append(f)
+
+    def load_files(self, files: Union[str, os.PathLike, IO, List[Union[str, os.PathLike, IO]]]):
+        """Loads configuration from files"""
+        with self._lock:
+            self._add_sources(files)
+            if self._observer is not None:
+                self._watch_files()
+            self._load_from_files()
+            self._update_data_from_all_x_data()._update_attributes_from_data()
     
     def load_args(self, args: list[str]):
-        if isinstance(args, str):
-            args = [args,]
-        self._load_from_args(_parse_args(args))
-        self._update_data_from_all_x_data()._update_attributes_from_data()
+        with self._lock:
+            if isinstance(args, str):
+                args = [args,]
+            self._load_from_args(_parse_args(args))
+            self._update_data_from_all_x_data()._update_attributes_from_data()
 
     def register_update_callback(self, callback: Callable[[], None]) -> None:
         """
@@ -476,7 +1097,7 @@ class Config(metaclass=Singleton):
         """
         missing_keys = []
         for key_str in keys_to_validate:
-            if not self._is_key_present_recursive(self.data, key_str.split('.')):
+            if not self._is_key_present_recursive(self.data, _split_key(key_str)):
                 missing_keys.append(key_str)
         
         if missing_keys:
@@ -484,65 +1105,69 @@ class Config(metaclass=Singleton):
             missing_keys.sort()
             raise ValueError(f"Missing configuration keys: {', '.join(missing_keys)}")
 
-    def _is_key_present_recursive(self, current_data: Any, path_parts: List[str]) -> bool:
+    def _is_key_present_recursive(self, current_data: Any, path_parts: Tuple[str, ...],
+                                  start: int = 0) -> bool:
         """
-        Internal recursive helper to check for key presence with wildcard support.
+        Internal helper to check for key presence with wildcard support.
+        Regular key parts are walked iteratively, recursion happens only
+        to check every child of a '%' wildcard. The path is checked from
+        index 'start', so no sub-tuples are allocated.
         """
-        if not path_parts:
-            # All parts of the key path have been successfully traversed.
-            return True
+        current = current_data
+        n_parts = len(path_parts)
+        for n in range(start, n_parts):
+            part = path_parts[n]
+            if type(current) is not dict:
+                # Expected a dictionary to look into (or to expand wildcard '%'),
+                # but found something else.
+                return False
 
-        part = path_parts[0]
-        remaining_parts = path_parts[1:]
+            if part == '%':
+                if not current or n + 1 == n_parts:
+                    # Current level is an empty dictionary, or the key is like "a.b.%"
+                    # and "a.b" is a dictionary (possibly empty), which is valid.
+                    return True
+                # Wildcard '%' followed by more path parts (e.g., "%.address").
+                # All children must satisfy the remaining parts.
+                return all(self._is_key_present_recursive(child_node, path_parts, n + 1)
+                           for child_node in current.values())
 
-        if part == '%':
-            if not isinstance(current_data, dict):
-                # Expected a dictionary to expand wildcard '%', but found something else
-                # or current_data is None (e.g. parent key did not exist).
+            # Regular key part: move to the next level of nesting.
+            current = current.get(part, _MISSING)
+            if current is _MISSING:
                 return False
 
-            if not current_data:
-                # Current level is an empty dictionary.
-                return True
-
-            if not remaining_parts:
-                # Key is like "a.b.%". This means "a.b" must be a dictionary.
-                # If we are here, current_data is a dictionary (possibly empty), which is valid.
-                return True
-
-            # Wildcard '%' followed by more path parts (e.g., "%.address").
-            # All children must satisfy the remaining_parts.
-            all_children_valid = True
-            # If current_data is an empty dict, the loop won't run, all_children_valid remains True.
-            for child_node in current_data.values():
-                if not self._is_key_present_recursive(child_node, remaining_parts):
-                    all_children_valid = False
-                    break  # If one child fails, the whole wildcard pattern fails for this level.
-            
-            return all_children_valid
-        
-        else: # Regular key part
-            if not isinstance(current_data, dict) or part not in current_data:
-                # Key part not found, or current_data is not a dictionary to look into.
-                return False
-            
-            # Move to the next level of nesting.
-            return self._is_key_present_recursive(current_data[part], remaining_parts)
+        # All parts of the key path have been successfully traversed.
+        return True
 
     def shutdown(self):
-        """Stops the polling"""
+        """Stops the polling or file observer"""
         self.shutdown_flag = True
+        if self._observer is not None:
+            self._observer.stop()
 
     def save(self, new_file: str = None, format: str = 'yaml') -> None:
-        """Saves the current configuration to a file"""
+        """
+        Saves the current merged configuration to a file
+
+        Args:
+            new_file: Path to save to, defaults to the first configuration file
+            format: 'yaml' or 'json'
+        """
         try:
             if not new_file:
-                new_file = self.file
-            with open(new_file, 'w') as f:
-                if format == 'yaml':
-                    yaml.safe_dump(self.config, f, default_flow_style=False, allow_unicode=True)
-                elif format == 'json':
-                    json.dump(self.config, f, indent=4)
+                if not self.files:
+                    raise ValueError("No file to save configuration to")
+                new_file = self.files[0]
+            if format == 'yaml':
+                with open(new_file, 'w') as f:
+                    yaml.dump(self.data, f, Dumper=_YamlDumper,
+                              default_flow_style=False, allow_unicode=True, sort_keys=False)
+            elif format == 'json':
+                with open(new_file, 'wb') as f:
+                    f.write(_json_dumps(self.data))
+            else:
+                raise ValueError(f"Unsupported format: {format}. Use 'yaml' or 'json'")
             log.info(f"Configuration successfully saved to {new_file}")
         except Exception as e:
             log.error(f"Error saving configuration: {e}")
@@ -557,41 +1182,59 @@ class Config(metaclass=Singleton):
         Returns:
             str: Formatted representation of attributes
         """
-        try:
-            from rich.console import Console
-            from rich.tree import Tree
-        except ImportError:
-            raise ImportError("To use format_attributes, you need to install 'rich' (pip install rich)")
-        
-        console = Console(record=True)
+        rich = _import_rich('format_attributes')
+        rich.console.print(self._build_tree(rich.Tree, show_private))
+        return rich.console.export_text()
+
+    def _build_tree(self, Tree: type, show_private: bool) -> 'Tree':
+        """Builds the rich Tree for format_attributes"""
         tree = Tree("📄 [bold light_sky_blue3]Configuration[/bold light_sky_blue3] ┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄┄")
         
-        def _add_dict_to_tree(d: dict, tree: Tree) -> None:
+        key_fmt = f"[{KEY_COLOR}]{{}}[/{KEY_COLOR}]"
+
+        def _add_number(node, label, value):
+            node.add(f"{label}: [pale_green3]{value}[/pale_green3]")
+
+        def _add_bool(node, label, value):
+            color = 'green' if value else 'red'
+            node.add(f"{label}: [{color}]{value}[/{color}]")
+
+        def _add_sequence(node, label, value):
+            branch = node.add(label)
+            for i, item in enumerate(value):
+                branch.add(f"[green]{i}:[/green] {item}")
+
+        def _add_none(node, label, value):
+            node.add(f"{label}: [dim]None[/dim]")
+
+        def _add_other(node, label, value):
+            node.add(f"{label}: {value}")
+
+        handlers = {
+            int: _add_number,
+            float: _add_number,
+            bool: _add_bool,
+            list: _add_sequence,
+            tuple: _add_sequence,
+            type(None): _add_none,
+        }
+        get_handler = handlers.get
+
+        # Iterative walk; each branch gets its children in order when it is popped
+        stack = [(self.data, tree)]
+        while stack:
+            d, node = stack.pop()
             for key, value in d.items():
                 if not show_private and str(key).startswith('_'):
                     continue
+                label = key_fmt.format(key)
                 if isinstance(value, dict):
-                    branch = tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]")
-                    _add_dict_to_tree(value, branch)
-                elif isinstance(value, (list, tuple)):
-                    branch = tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]")
-                    for i, item in enumerate(value):
-                        branch.add(f"[green]{i}:[/green] {item}")
-                elif isinstance(value, (int, float)):
-                    tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]: [pale_green3]{value}[/pale_green3]")
-                elif isinstance(value, bool):
-                    color = 'green' if value else 'red'
-                    tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]: [{color}]{value}[/{color}]")
-                elif value is None:
-                    tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]: [dim]None[/dim]")
+                    stack.append((value, node.add(label)))
                 else:
-                    tree.add(f"[{KEY_COLOR}]{key}[/{KEY_COLOR}]: {value}")
-        
-        _add_dict_to_tree(self.data, tree)
+                    get_handler(type(value), _add_other)(node, label, value)
+
         tree.add(f"[dim]Config file:[/dim] {self.files}")
-        
-        console.print(tree)
-        return console.export_text()
+        return tree
 
     def print_config(self, show_private: bool = False) -> None:
         """
@@ -609,42 +1252,41 @@ class Config(metaclass=Singleton):
         Returns:
             str: Tabular representation of the configuration
         """
-        try:
-            from rich.console import Console
-            from rich.table import Table
-        except ImportError:
-            raise ImportError("To use get_table_view, you need to install 'rich' (pip install rich)")
-        
-        console = Console(record=True)
+        rich = _import_rich('get_table_view')
+        rich.console.print(self._build_table(rich.Table))
+        return rich.console.export_text()
+
+    def _build_table(self, Table: type) -> 'Table':
+        """Builds the rich Table for get_table_view"""
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Section", style="dim")
         table.add_column("Key", style="yellow")
         table.add_column("Value", style="green")
         table.add_column("Type", style="blue")
         
-        def _add_to_table(data: dict, section: str = "") -> None:
-            """Recursively adds items to the table"""
-            for key, value in data.items():
+        # Collect rows in depth-first order, then add them in one pass
+        rows = []
+        append = rows.append
+        stack = [(iter(self.data.items()), "")]
+        while stack:
+            items, section = stack[-1]
+            for key, value in items:
                 if isinstance(value, dict):
-                    new_section = f"{section}.{key}" if section else key
-                    _add_to_table(value, new_section)
-                else:
-                    table.add_row(
-                        section,
-                        key,
-                        str(value),
-                        type(value).__name__
-                    )
-        
-        _add_to_table(self.data)
-        console.print(table)
-        return console.export_text()
+                    stack.append((iter(value.items()), f"{section}.{key}" if section else key))
+                    break
+                append((section, key, str(value), type(value).__name__))
+            else:
+                stack.pop()
+
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        return table
 
     @classmethod
     def _reset(cls):
         """Resets the singleton for testing"""
-        if hasattr(cls, '_instances'):
-            cls._instances.clear()
+        cls._instance = None
 
 
 if __name__ == '__main__':
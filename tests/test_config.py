@@ -1,20 +1,80 @@
 import pytest
 import os
+import copy
+import io
 import sys
-import tempfile
+import time
 import yaml
+import json
 import logging
+from dataclasses import is_dataclass, FrozenInstanceError
 from pathlib import Path
 
+# Быстрые C-реализации (LibYAML), если доступны
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 # Настройка логирования
 log = logging.getLogger(__name__)
-log.setLevel(logging.DEBUG)
 # Добавляем путь к src в PYTHONPATH
 src_path = str(Path(__file__).parent.parent / 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from kimiconfig import Config, _parse_args
+from kimiconfig import Config
+from kimiconfig.config import _parse_args, _convert_value, _intern_keys
+
+# Содержимое конфиг-файлов фикстур, сериализуется один раз при импорте
+_SIMPLE_CONFIG = {
+    'host': 'localhost',
+    'port': 8080,
+    'debug': True,
+    'numbers': [1, 2, 3],
+    'nested': {
+        'key': 'value',
+        'number': 42
+    }
+}
+
+_NESTED_CONFIG = {
+    'webapi_options': {
+        'host': '127.0.0.1',
+        'port': 8080,
+        'settings': {
+            'timeout': 30,
+            'retry': True,
+            'max_attempts': 3
+        }
+    },
+    'database': {
+        'url': 'postgresql://localhost/db',
+        'pool_size': 5
+    }
+}
+
+_BASE_CONFIG = {
+    'webapi': {
+        'host': '127.0.0.1',
+        'port': 8080,
+        'debug': False
+    },
+    'base_value': 'not_overridden'
+}
+
+_OVERRIDE_CONFIG = {
+    'webapi': {
+        'port': 9090,
+        'debug': True
+    },
+    'override_value': 'new'
+}
+
+_SIMPLE_YAML = yaml.dump(_SIMPLE_CONFIG, Dumper=_Dumper).encode()
+_NESTED_YAML = yaml.dump(_NESTED_CONFIG, Dumper=_Dumper).encode()
+_BASE_YAML = yaml.dump(_BASE_CONFIG, Dumper=_Dumper).encode()
+_OVERRIDE_YAML = yaml.dump(_OVERRIDE_CONFIG, Dumper=_Dumper).encode()
 
 @pytest.fixture(autouse=True)
 def reset_singleton():
@@ -25,93 +85,44 @@ def reset_singleton():
     yield  # Выполнение теста
     Config._reset()  # Сброс после теста
 
-@pytest.fixture
-def simple_config_file():
-    """Фикстура для создания простого конфиг-файла"""
-    config_data = {
-        'host': 'localhost',
-        'port': 8080,
-        'debug': True,
-        'numbers': [1, 2, 3],
-        'nested': {
-            'key': 'value',
-            'number': 42
-        }
-    }
+@pytest.fixture(scope="session")
+def simple_config_file(tmp_path_factory):
+    """Фикстура для создания простого конфиг-файла (один раз на сессию)"""
+    path = tmp_path_factory.mktemp('cfg') / 'simple.yaml'
+    path.write_bytes(_SIMPLE_YAML)
+    log.debug('Created simple config file: %s', path)
+    log.debug('Content: %s', _SIMPLE_CONFIG)
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.safe_dump(config_data, f)
-        temp_file = f.name
-        log.info(f'Created simple config file: {temp_file}')
-        log.info(f'Content: {config_data}')
-    
-    yield temp_file
-    os.unlink(temp_file)
-
-@pytest.fixture
-def nested_config_file():
-    """Фикстура для создания конфиг-файла со сложной структурой"""
-    config_data = {
-        'webapi_options': {
-            'host': '127.0.0.1',
-            'port': 8080,
-            'settings': {
-                'timeout': 30,
-                'retry': True,
-                'max_attempts': 3
-            }
-        },
-        'database': {
-            'url': 'postgresql://localhost/db',
-            'pool_size': 5
-        }
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.safe_dump(config_data, f)
-        temp_file = f.name
-        log.info(f'Created nested config file: {temp_file}')
-        log.info(f'Content: {config_data}')
-    
-    yield temp_file
-    os.unlink(temp_file)
-
-@pytest.fixture
-def multiple_config_files():
-    """Фикстура для создания нескольких конфиг-файлов с перезаписью значений"""
-    base_config = {
-        'webapi': {
-            'host': '127.0.0.1',
-            'port': 8080,
-            'debug': False
-        },
-        'base_value': 'not_overridden'
-    }
-    
-    override_config = {
-        'webapi': {
-            'port': 9090,
-            'debug': True
-        },
-        'override_value': 'new'
-    }
+    return str(path)
+
+@pytest.fixture(scope="session")
+def nested_config_file(tmp_path_factory):
+    """Фикстура для создания конфиг-файла со сложной структурой (один раз на сессию)"""
+    path = tmp_path_factory.mktemp('cfg') / 'nested.yaml'
+    path.write_bytes(_NESTED_YAML)
+    log.debug('Created nested config file: %s', path)
+    log.debug('Content: %s', _NESTED_CONFIG)
     
+    return str(path)
+
+@pytest.fixture(scope="session")
+def multiple_config_files(tmp_path_factory):
+    """Фикстура для создания нескольких конфиг-файлов с перезаписью значений (один раз на сессию)"""
+    directory = tmp_path_factory.mktemp('cfg')
     files = []
-    for i, config in enumerate([base_config, override_config]):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.safe_dump(config, f)
-            files.append(f.name)
-            log.info(f'Created config file {i+1}: {f.name}')
-            log.info(f'Content: {config}')
-    
-    yield files
+    for i, (config, content) in enumerate([(_BASE_CONFIG, _BASE_YAML),
+                                           (_OVERRIDE_CONFIG, _OVERRIDE_YAML)]):
+        path = directory / f'config_{i+1}.yaml'
+        path.write_bytes(content)
+        files.append(str(path))
+        log.debug('Created config file %d: %s', i + 1, path)
+        log.debug('Content: %s', config)
     
-    for file in files:
-        os.unlink(file)
+    return files
 
 def test_simple_config(simple_config_file):
     """Тест базовой загрузки конфигурации"""
-    cfg = Config(simple_config_file)
+    cfg = Config(simple_config_file, use_dataclasses=False)
     
     assert cfg.host == 'localhost'
     assert cfg.port == 8080
@@ -123,7 +134,6 @@ def test_simple_config(simple_config_file):
 def test_nested_config_with_dataclasses(nested_config_file):
     """Тест загрузки конфигурации с использованием датаклассов"""
     cfg = Config(nested_config_file, use_dataclasses=True)
-    log.debug(f'{cfg.__dict__=}')
     
     assert cfg.webapi_options.host == '127.0.0.1'
     assert cfg.webapi_options.port == 8080
@@ -134,7 +144,7 @@ def test_nested_config_with_dataclasses(nested_config_file):
 
 def test_multiple_files_override(multiple_config_files):
     """Тест перезаписи значений при загрузке нескольких файлов"""
-    cfg = Config(multiple_config_files)
+    cfg = Config(multiple_config_files, use_dataclasses=False)
     
     # Проверяем перезаписанные значения
     assert cfg.webapi['port'] == 9090  # Перезаписано из второго файла
@@ -152,6 +162,22 @@ def test_cli_args():
     assert result['port'] == 8080
     assert result['nested']['value'] == 'test'
     assert result['v'] is True
+    
+    # Каждый вызов возвращает независимый словарь
+    result['nested']['value'] = 'changed'
+    assert _parse_args(args)['nested']['value'] == 'test'
+
+def test_convert_value():
+    """Тест преобразования строк в bool/int/float"""
+    assert _convert_value('yes') is True
+    assert _convert_value('42') == 42
+    assert _convert_value(' 42') == 42  # Пробелы вокруг числа игнорируются, как в int()
+    assert _convert_value('42 \n') == 42
+    assert _convert_value('1_000') == 1000
+    assert _convert_value('1.5') == 1.5
+    assert _convert_value('1e3') == 1000.0
+    assert _convert_value('1.2.3') == '1.2.3'
+    assert _convert_value(' host ') == ' host '
 
 def test_config_with_cli_args(simple_config_file):
     """Тест конфигурации с аргументами командной строки"""
@@ -186,12 +212,13 @@ def test_config_update():
     assert cfg.data['test_key'] == 'test_value'
 
 
-def test_custom_env_prefix():
+@pytest.mark.xdist_group("env")
+def test_custom_env_prefix(monkeypatch):
     # Установка тестовых переменных окружения с разными префиксами
-    os.environ['MY_APP_DATABASE__HOST'] = 'localhost'
-    os.environ['MY_APP_DATABASE__PORT'] = '5432'
-    os.environ['MY_APP_DATABASE__SSL'] = 'true'
-    os.environ['OTHER_PREFIX_SETTING'] = 'should_not_load'
+    monkeypatch.setenv('MY_APP_DATABASE__HOST', 'localhost')
+    monkeypatch.setenv('MY_APP_DATABASE__PORT', '5432')
+    monkeypatch.setenv('MY_APP_DATABASE__SSL', 'true')
+    monkeypatch.setenv('OTHER_PREFIX_SETTING', 'should_not_load')
     
     config_data = """
     database:
@@ -200,78 +227,367 @@ def test_custom_env_prefix():
         ssl: false
     """
     
-    with open('test_config.yaml', 'w') as f:
-        f.write(config_data)
+    # Создаем конфиг с пользовательским префиксом, YAML читается прямо из памяти
+    cfg = Config(io.StringIO(config_data), env_prefix='MY_APP_', use_dataclasses=True)
     
-    try:
-        # Создаем конфиг с пользовательским префиксом
-        cfg = Config('test_config.yaml', env_prefix='MY_APP_', use_dataclasses=True)
-        
-        # Проверяем, что значения из переменных окружения с нужным префиксом загрузились
-        assert cfg.database.host == 'localhost'
-        assert cfg.database.port == 5432
-        assert cfg.database.ssl == True
-        
-        # Проверяем, что переменная с другим префиксом не повлияла на конфиг
-        assert not hasattr(cfg, 'OTHER_PREFIX_SETTING')
-        assert not hasattr(cfg, 'setting')
-        
-    finally:
-        # Очистка
-        if os.path.exists('test_config.yaml'):
-            os.remove('test_config.yaml')
-        del os.environ['MY_APP_DATABASE__HOST']
-        del os.environ['MY_APP_DATABASE__PORT']
-        del os.environ['MY_APP_DATABASE__SSL']
-        del os.environ['OTHER_PREFIX_SETTING']
-
-def test_nested_env_variables_with_prefix():
-    os.environ['MYAPP_SERVICE__API__URL'] = 'http://api.example.com'
-    os.environ['MYAPP_SERVICE__API__VERSION'] = '2'
-    os.environ['MYAPP_SERVICE__TIMEOUT'] = '30.5'
+    # Проверяем, что значения из переменных окружения с нужным префиксом загрузились
+    assert cfg.database.host == 'localhost'
+    assert cfg.database.port == 5432
+    assert cfg.database.ssl == True
     
-    try:
-        cfg = Config(env_prefix='MYAPP_', use_dataclasses=True)
-        
-        # Проверяем правильность создания вложенной структуры
-        assert cfg.service.api.url == 'http://api.example.com'
-        assert cfg.service.api.version == 2
-        assert cfg.service.timeout == 30.5
-        
-    finally:
-        del os.environ['MYAPP_SERVICE__API__URL']
-        del os.environ['MYAPP_SERVICE__API__VERSION']
-        del os.environ['MYAPP_SERVICE__TIMEOUT']
-
-def test_env_prefix_type_conversion():
-    os.environ['TEST_VALUES__STRING'] = 'hello'
-    os.environ['TEST_VALUES__INT'] = '42'
-    os.environ['TEST_VALUES__FLOAT'] = '3.14'
-    os.environ['TEST_VALUES__BOOL_TRUE'] = 'yes'
-    os.environ['TEST_VALUES__BOOL_FALSE'] = 'no'
+    # Проверяем, что переменная с другим префиксом не повлияла на конфиг
+    assert not hasattr(cfg, 'OTHER_PREFIX_SETTING')
+    assert not hasattr(cfg, 'setting')
+
+@pytest.mark.xdist_group("env")
+@pytest.mark.parametrize("prefix,env,checks", [
+    # Правильность создания вложенной структуры
+    ('MYAPP_', {
+        'MYAPP_SERVICE__API__URL': 'http://api.example.com',
+        'MYAPP_SERVICE__API__VERSION': '2',
+        'MYAPP_SERVICE__TIMEOUT': '30.5',
+    }, [
+        ('service.api.url', 'http://api.example.com'),
+        ('service.api.version', 2),
+        ('service.timeout', 30.5),
+    ]),
+    # Автоматическое преобразование типов
+    ('TEST_', {
+        'TEST_VALUES__STRING': 'hello',
+        'TEST_VALUES__INT': '42',
+        'TEST_VALUES__FLOAT': '3.14',
+        'TEST_VALUES__BOOL_TRUE': 'yes',
+        'TEST_VALUES__BOOL_FALSE': 'no',
+    }, [
+        ('values.string', 'hello'),
+        ('values.int', 42),
+        ('values.float', 3.14),
+        ('values.bool_true', True),
+        ('values.bool_false', False),
+    ]),
+], ids=['nested', 'type_conversion'])
+def test_env_prefix(prefix, env, checks, monkeypatch):
+    """Тест загрузки вложенных переменных окружения с префиксом"""
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    
+    cfg = Config(env_prefix=prefix, use_dataclasses=True)
     
+    for path, expected in checks:
+        value = cfg
+        for part in path.split('.'):
+            value = getattr(value, part)
+        assert type(value) is type(expected), path
+        assert value == expected, path
+
+@pytest.mark.xdist_group("env")
+def test_env_value_and_section_with_same_key(monkeypatch):
+    """Тест: переменная-значение и вложенная переменная с тем же ключом не ломают загрузку"""
+    monkeypatch.setenv('DEFAULT_APP_DB', 'sqlite')
+    monkeypatch.setenv('DEFAULT_APP_DB__HOST', 'localhost')
+
+    cfg = Config(use_dataclasses=False)
+    assert cfg.data['db'] == {'host': 'localhost'}
+
+def test_intern_keys_with_aliases():
+    """Тест: общие и самоссылающиеся словари (YAML-алиасы) обрабатываются один раз"""
+    data = yaml.load('shared: &s {k: 1}\na: *s\ncyc: &c {self: *c}\n', Loader=_Loader)
+    assert _intern_keys(data) is data
+    assert data['a'] is data['shared']
+    assert data['cyc']['self'] is data['cyc']
+
+def test_self_referencing_file_is_reported(tmp_path, caplog):
+    """Тест: файл с самоссылающимся YAML-алиасом сообщается как ошибка, а не зависает"""
+    config_path = tmp_path / 'cyclic.yaml'
+    config_path.write_text('a: &x {b: *x}\n')
+
+    with caplog.at_level(logging.ERROR):
+        Config(str(config_path))
+    assert 'contains itself' in caplog.text
+
+def test_unreadable_file_path_is_reported(tmp_path, caplog):
+    """Тест: путь, который нельзя открыть, сообщается как ошибка, а не роняет инициализацию"""
+    not_a_dir = tmp_path / 'file'
+    not_a_dir.write_text('')
+    config_path = str(not_a_dir / 'config.yaml')
+
+    with caplog.at_level(logging.ERROR):
+        cfg = Config(config_path)
+    assert cfg.file_stamps == {}
+    assert 'Error loading configuration' in caplog.text
+
+def test_parse_cache_invalidated_on_change(tmp_path):
+    """Тест кэша разбора файлов: изменённый файл перечитывается"""
+    config_path = tmp_path / 'cached.yaml'
+    config_path.write_text('value: 1\n')
+
+    cfg = Config(str(config_path))
+    assert cfg.value == 1
+
+    # Меняем размер и mtime файла — ключ кэша должен измениться
+    config_path.write_text('value: 200\n')
+    os.utime(config_path, ns=(0, os.stat(config_path).st_mtime_ns + 1_000_000))
+    cfg.load_files([])
+    assert cfg.value == 200
+
+def test_disk_cache(tmp_path, monkeypatch, simple_config_file):
+    """Тест дискового кэша разобранных файлов (use_cache=True)"""
+    import kimiconfig.config as config_module
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(config_module, '_CACHE_DIR', str(cache_dir))
+    config_module._PARSE_CACHE.clear()
+
+    cfg = Config(simple_config_file, use_cache=True)
+    assert cfg.host == 'localhost'
+    assert len(list(cache_dir.glob('*.pkl'))) == 1
+
+    # Повторная загрузка берёт данные из кэша на диске, файл не разбирается
+    Config._reset()
+    config_module._PARSE_CACHE.clear()
+    def fail_parse(*args):
+        raise AssertionError('file was re-parsed instead of read from the disk cache')
+    monkeypatch.setattr(config_module, '_parse_file', fail_parse)
+    cfg = Config(simple_config_file, use_cache=True)
+    assert cfg.port == 8080
+    assert len(list(cache_dir.glob('*.pkl'))) == 1
+
+def test_update_nested_matches_full_rebuild(nested_config_file):
+    """Тест update(): точечное обновление даёт тот же результат, что и полная пересборка"""
+    cfg = Config(nested_config_file, args=['--database.pool_size=10'])
+    cfg.update('webapi_options.settings.timeout', 60)
+    cfg.update('database', {'user': 'admin'})
+
+    assert cfg.webapi_options.settings.timeout == 60
+    assert cfg.webapi_options.settings.retry is True
+    assert cfg.database.pool_size == 10
+    assert cfg.database.user == 'admin'
+
+    patched = copy.deepcopy(cfg.data)
+    cfg._update_data_from_all_x_data()
+    assert cfg.data == patched
+
+    # Секция, замененная скаляром, при обновлении вложенного ключа снова объединяется с файлом
+    cfg.update('database', 'off')
+    cfg.update('database.pool_size', 20)
+    assert cfg.data['database'] == {'url': 'postgresql://localhost/db', 'pool_size': 20}
+
+    patched = copy.deepcopy(cfg.data)
+    cfg._update_data_from_all_x_data()
+    assert cfg.data == patched
+
+def test_dataclass_reused_between_updates(nested_config_file):
+    """Тест кэша датаклассов: структура не изменилась — класс переиспользуется"""
+    cfg = Config(nested_config_file, use_dataclasses=True)
+    settings_cls = type(cfg.webapi_options.settings)
+
+    cfg.update('webapi_options.settings.timeout', 45)
+    assert type(cfg.webapi_options.settings) is settings_cls
+    assert cfg.webapi_options.settings.timeout == 45
+
+    cfg.update('webapi_options.settings.new_field', 1)
+    assert type(cfg.webapi_options.settings) is not settings_cls
+    assert cfg.webapi_options.settings.new_field == 1
+
+def test_unchanged_sections_keep_attributes(nested_config_file):
+    """Тест: при пересборке неизменённые секции не пересоздаются"""
+    cfg = Config(nested_config_file, use_dataclasses=True)
+    database = cfg.database
+
+    cfg.load_args(['--webapi_options.port=9000'])
+    assert cfg.webapi_options.port == 9000
+    assert cfg.database is database
+
+def test_unsupported_file_format(tmp_path):
+    """Тест: файл с неизвестным расширением отклоняется сразу"""
+    config_path = tmp_path / 'config.ini'
+    config_path.write_text('[section]\nkey=value\n')
+
+    with pytest.raises(ValueError, match='Unsupported configuration file format'):
+        Config(str(config_path))
+
+def test_file_sources(simple_config_file, nested_config_file):
+    """Тест: None, pathlib.Path и потоки как источники конфигурации"""
+    cfg = Config(None)
+    assert cfg.files == []
+
+    Config._reset()
+    cfg = Config(Path(simple_config_file))
+    assert cfg.files == [simple_config_file]
+    assert cfg.host == 'localhost'
+
+    cfg.load_files(Path(nested_config_file))
+    assert cfg.files == [simple_config_file, nested_config_file]
+    assert cfg.database.pool_size == 5
+
+    # Поток без словаря на верхнем уровне отклоняется сразу
+    Config._reset()
+    with pytest.raises(ValueError, match='mapping at the top level, got list'):
+        Config(io.StringIO('- a\n- b\n'))
+
+def test_update_many(simple_config_file):
+    """Тест пакетного обновления update_many"""
+    cfg = Config(simple_config_file)
+    cfg.update_many({'port': 9000, 'nested.key': 'new', 'extra.value': 1})
+    cfg.update_many([('host', 'example.com')])
+
+    assert cfg.port == 9000
+    assert cfg.host == 'example.com'
+    assert cfg.nested.key == 'new'
+    assert cfg.nested.number == 42
+    assert cfg.extra.value == 1
+
+    with pytest.raises(ValueError):
+        cfg.update_many({'port': 1, 'update': 'conflict'})
+    assert cfg.port == 9000
+
+def test_lazy_dataclass_sections(nested_config_file):
+    """Тест: датаклассы секций создаются только при первом обращении"""
+    cfg = Config(nested_config_file, use_dataclasses=True)
+    assert 'database' not in cfg.__dict__
+
+    assert cfg.database.pool_size == 5
+    assert is_dataclass(cfg.database)
+    assert 'database' in cfg.__dict__
+
+    cfg.update('database', 'plain')
+    assert cfg.database == 'plain'
+    cfg.update('database', {'pool_size': 5})
+    assert cfg.database.pool_size == 5
+
+def test_lazy_dataclass_section_conversion_error(tmp_path):
+    """Тест: секция, которую нельзя превратить в датакласс, не теряется после ошибки"""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('sec:\n  class: 1\n')
+    cfg = Config(str(config_path), use_dataclasses=True)
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            cfg.sec
+    assert cfg.data['sec'] == {'class': 1}
+    assert getattr(cfg, 'missing', None) is None
+
+def test_save(tmp_path, nested_config_file):
+    """Тест сохранения объединённой конфигурации в YAML и JSON"""
+    cfg = Config(nested_config_file)
+    cfg.update('database.pool_size', 20)
+
+    yaml_path = tmp_path / 'saved.yaml'
+    json_path = tmp_path / 'saved.json'
+    cfg.save(str(yaml_path))
+    cfg.save(str(json_path), format='json')
+
+    assert yaml.load(yaml_path.read_text(), Loader=_Loader) == cfg.data
+    assert json.loads(json_path.read_text()) == cfg.data
+
+    # Ключи разных типов (YAML это допускает) сохраняются в JSON строками, порядок сохраняется
+    cfg.update('ports', {80: 'http', 'name': 'x'})
+    cfg.save(str(json_path), format='json')
+    assert list(json.loads(json_path.read_text())['ports'].items()) == [('80', 'http'), ('name', 'x')]
+
+def test_removed_keys_are_dropped(tmp_path):
+    """Тест: ключи, удалённые из файла, пропадают после перезагрузки"""
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('keep: 1\nremove: 2\nsection:\n  key: value\n')
+
+    cfg = Config(str(config_path))
+    assert cfg.remove == 2
+
+    config_path.write_text('keep: 1\n')
+    os.utime(config_path, ns=(0, os.stat(config_path).st_mtime_ns + 1_000_000))
+    cfg._reload_files()
+
+    assert cfg.keep == 1
+    assert 'remove' not in cfg.data
+    assert not hasattr(cfg, 'remove')
+    assert not hasattr(cfg, 'section')
+
+def test_dataclass_sections_are_frozen(nested_config_file):
+    """Тест: секции-датаклассы неизменяемы, значения меняются через update()"""
+    cfg = Config(nested_config_file, use_dataclasses=True)
+    with pytest.raises(FrozenInstanceError):
+        cfg.database.pool_size = 10
+
+    cfg.update('database.pool_size', 10)
+    assert cfg.database.pool_size == 10
+    # Атрибуты секций по-прежнему доступны через __dict__/vars()
+    assert vars(cfg.database)['pool_size'] == 10
+
+def test_watch_with_watchdog(tmp_path):
+    """Тест отслеживания изменений файла через watchdog"""
+    pytest.importorskip('watchdog')
+    config_path = tmp_path / 'watched.yaml'
+    config_path.write_text('value: 1\n')
+
+    cfg = Config(str(config_path), watch_mtime=True)
+    updates = []
+    cfg.register_update_callback(lambda: updates.append(cfg.value))
     try:
-        cfg = Config(env_prefix='TEST_', use_dataclasses=True)
-        
-        # Проверяем автоматическое преобразование типов
-        assert isinstance(cfg.values.string, str)
-        assert cfg.values.string == 'hello'
-        
-        assert isinstance(cfg.values.int, int)
-        assert cfg.values.int == 42
-        
-        assert isinstance(cfg.values.float, float)
-        assert cfg.values.float == 3.14
-        
-        assert isinstance(cfg.values.bool_true, bool)
-        assert cfg.values.bool_true == True
-        
-        assert isinstance(cfg.values.bool_false, bool)
-        assert cfg.values.bool_false == False
-        
+        assert cfg._observer is not None
+        config_path.write_text('value: 2\n')
+        deadline = time.monotonic() + 5
+        while cfg.value != 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert cfg.value == 2
+        assert updates and updates[-1] == 2
     finally:
-        del os.environ['TEST_VALUES__STRING']
-        del os.environ['TEST_VALUES__INT']
-        del os.environ['TEST_VALUES__FLOAT']
-        del os.environ['TEST_VALUES__BOOL_TRUE']
-        del os.environ['TEST_VALUES__BOOL_FALSE']
+        cfg.shutdown()
+
+def test_file_stamps_windows_scandir(tmp_path, monkeypatch):
+    """Тест: на Windows отметки времени читаются через os.scandir без учета регистра имен"""
+    import ntpath
+    (tmp_path / 'settings.yaml').write_text('value: 1\n')
+    config_file = str(tmp_path / 'Settings.YAML')
+    cfg = Config(config_file)
+
+    scanned = []
+    real_scandir = os.scandir
+    def fake_scandir(path):
+        scanned.append(path)
+        return real_scandir(path)
+
+    with monkeypatch.context() as m:
+        m.setattr(os, 'name', 'nt')
+        m.setattr(os.path, 'normcase', ntpath.normcase)
+        m.setattr(os, 'scandir', fake_scandir)
+        stamps = cfg._current_file_stamps()
+
+    assert scanned == [str(tmp_path)]
+    assert stamps == {config_file: (tmp_path / 'settings.yaml').stat().st_mtime_ns}
+
+def test_validate_config(tmp_path):
+    """Тест проверки наличия ключей, в том числе с шаблоном '%'"""
+    config_path = tmp_path / 'servers.yaml'
+    config_path.write_text(
+        'servers:\n'
+        '  one: {address: 10.0.0.1}\n'
+        '  two: {address: 10.0.0.2, port: 22}\n'
+        'empty: {}\n'
+        'plain: 1\n'
+    )
+    cfg = Config(str(config_path))
+
+    cfg.validate_config(['servers.one.address', 'servers.%.address', 'empty.%.x', 'empty.%'])
+
+    with pytest.raises(ValueError, match='plain.%, servers.%.port, servers.one.port'):
+        cfg.validate_config(['servers.%.port', 'servers.one.port', 'plain.%'])
+
+def test_format_attributes_reflects_updates(simple_config_file):
+    """Тест: вывод format_attributes обновляется после изменения конфигурации"""
+    pytest.importorskip('rich')
+    cfg = Config(simple_config_file)
+    assert 'localhost' in cfg.format_attributes()
+    assert 'localhost' in cfg.format_attributes()
+
+    cfg.update('host', 'example.com')
+    text = cfg.format_attributes()
+    assert 'example.com' in text
+    assert 'localhost' not in text
+    assert 'example.com' in cfg.get_table_view()
+
+    # Изменение словаря на месте (use_dataclasses=False) тоже видно в выводе
+    Config._reset()
+    cfg = Config(simple_config_file, use_dataclasses=False)
+    assert '4242' not in cfg.format_attributes()
+    cfg.nested['number'] = 4242
+    assert '4242' in cfg.format_attributes()
+    assert '4242' in cfg.get_table_view()